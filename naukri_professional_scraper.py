@@ -1,30 +1,54 @@
 
 
+import asyncio
+import math
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-import json
+import orjson
 import csv
-import time
 import random
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
+import re
+from collections import Counter
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from itertools import islice
+from datetime import datetime
+from operator import attrgetter
 from urllib.parse import urljoin
 import sys
 from pathlib import Path
 
-# Configure logging
+# Configure logging: records are formatted by the QueueHandler and
+# written to file/console by a background listener thread
+_log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('naukri_scraper.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('naukri_scraper.log'),
+    logging.StreamHandler()
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Naukri's internal location IDs
+_LOCATION_IDS = {
+    "bangalore": "4", "mumbai": "1", "delhi": "2", "pune": "3",
+    "hyderabad": "5", "chennai": "6", "kolkata": "7",
+    "gurugram": "2050", "noida": "2051", "gurgaon": "2050"
+}
+
+@dataclass(slots=True)
 class JobData:
     """Data structure for job information"""
     job_title: str = ""
@@ -35,12 +59,32 @@ class JobData:
     job_url: str = ""
     scraped_at: str = ""
 
+JOB_COLUMNS = [f.name for f in fields(JobData)]
+_job_row = attrgetter(*JOB_COLUMNS)
+
+# Characters stripped from keywords when building output filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w -]+')
+
+def _clean(value) -> str:
+    """Convert an API value to a stripped string, treating None as empty"""
+    return "" if value is None else str(value).strip()
+
 class NaukriScraper:
     """
     Professional Naukri.com job scraper implementing best practices
     for handling dynamic content and anti-bot measures.
     """
 
+    # Upper bound on page requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # Rotated per request to avoid detection
+    _USER_AGENTS = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
     def __init__(self):
         self.session = self._setup_session()
         self.base_url = "https://www.naukri.com"
@@ -57,18 +101,10 @@ class NaukriScraper:
         """
         session = requests.Session()
 
-        # Rotate user agents to avoid detection
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-
         session.headers.update({
-            "User-Agent": random.choice(user_agents),
+            "User-Agent": random.choice(self._USER_AGENTS),
             "Accept": "application/json, text/plain, */*",
             "Accept-Language": "en-US,en;q=0.9",
-            # Remove Accept-Encoding to avoid gzip compression issues
             "Referer": "https://www.naukri.com/",
             "Origin": "https://www.naukri.com",
             "DNT": "1",
@@ -78,9 +114,20 @@ class NaukriScraper:
             "Sec-Fetch-Site": "same-origin",
         })
 
+        # Keep-alive connection pool with exponential backoff on 429/5xx
+        retry = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=2,
+            allowed_methods=["GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session.mount("https://", adapter)
+
         return session
 
-    def _get_location_id(self, location: str) -> str:
+    @staticmethod
+    def _get_location_id(location: str) -> str:
         """
         Convert location name to Naukri's internal location ID
 
@@ -90,33 +137,7 @@ class NaukriScraper:
         Returns:
             Location ID string or original location if not mapped
         """
-        location_mapping = {
-            "bangalore": "4", "mumbai": "1", "delhi": "2", "pune": "3",
-            "hyderabad": "5", "chennai": "6", "kolkata": "7", 
-            "gurugram": "2050", "noida": "2051", "gurgaon": "2050"
-        }
-        return location_mapping.get(location.lower(), location.lower())
-
-    def _safe_extract(self, data: Dict, key: str, default: str = "") -> str:
-        """
-        Safely extract and clean data from API response
-
-        Args:
-            data: Dictionary containing job data
-            key: Key to extract
-            default: Default value if key not found
-
-        Returns:
-            Cleaned string value
-        """
-        try:
-            value = data.get(key, default)
-            if value is None:
-                return default
-            return str(value).strip()
-        except Exception as e:
-            logger.warning(f"Error extracting {key}: {e}")
-            return default
+        return _LOCATION_IDS.get(location.lower(), location.lower())
 
     def _safe_int_convert(self, value) -> str:
         """Safely convert scientific notation to integer string"""
@@ -127,12 +148,13 @@ class NaukriScraper:
         except (ValueError, TypeError):
             return str(value)
 
-    def _parse_job_data(self, job_raw: Dict) -> JobData:
+    def _parse_job_data(self, job_raw: Dict, scraped_at: Optional[str] = None) -> JobData:
         """
         Parse raw job data from API response into structured format
 
         Args:
             job_raw: Raw job data from API
+            scraped_at: Scrape timestamp shared by the page (defaults to now)
 
         Returns:
             Structured JobData object
@@ -146,9 +168,9 @@ class NaukriScraper:
             # Extract and clean job description
             description_parts = []
             if job_raw.get("jobDesc"):
-                description_parts.append(self._safe_extract(job_raw, "jobDesc"))
+                description_parts.append(_clean(job_raw.get("jobDesc")))
             if job_raw.get("tagsAndSkills"):
-                description_parts.append(f"Skills: {self._safe_extract(job_raw, 'tagsAndSkills')}")
+                description_parts.append(f"Skills: {_clean(job_raw.get('tagsAndSkills'))}")
 
             description = " | ".join(description_parts)
             # Limit description length for clean output
@@ -156,13 +178,13 @@ class NaukriScraper:
                 description = description[:300] + "..."
 
             return JobData(
-                job_title=self._safe_extract(job_raw, "post"),
-                company_name=self._safe_extract(job_raw, "companyName"),
+                job_title=_clean(job_raw.get("post")),
+                company_name=_clean(job_raw.get("companyName")),
                 job_id=job_id,
                 job_description=description,
-                location=self._safe_extract(job_raw, "city"),
+                location=_clean(job_raw.get("city")),
                 job_url=job_url,
-                scraped_at=pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
+                scraped_at=scraped_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             )
 
         except Exception as e:
@@ -172,7 +194,8 @@ class NaukriScraper:
 
     def _make_api_request(self, params: Dict) -> Tuple[bool, Dict]:
         """
-        Make API request with error handling and retry logic
+        Make API request with error handling. Retries and backoff on
+        429/5xx are handled by the session's mounted adapter.
 
         Args:
             params: Request parameters
@@ -180,51 +203,71 @@ class NaukriScraper:
         Returns:
             Tuple of (success: bool, response_data: dict)
         """
-        max_retries = 3
-        retry_delay = 2
-
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"Making API request (attempt {attempt + 1})")
-
-                response = self.session.get(
-                    self.api_endpoint,
-                    params=params,
-                    timeout=30
-                )
-
-                if response.status_code == 200:
-                    try:
-                        return True, response.json()
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON decode error: {e}")
-                        logger.debug(f"Response content: {response.text[:200]}")
-                        self.errors_encountered.append(f"JSON decode error: {e}")
-                        return False, {}
-
-                elif response.status_code == 429:  # Rate limited
-                    logger.warning(f"Rate limited. Waiting {retry_delay * 2} seconds...")
-                    time.sleep(retry_delay * 2)
-                    continue
-
-                else:
-                    logger.error(f"HTTP {response.status_code}: {response.text[:200]}")
-                    self.errors_encountered.append(f"HTTP {response.status_code}")
+        try:
+            logger.info(f"Making API request (page {params.get('pageNo')})")
+
+            # Pass the rotated agent per request; pages share the session across threads
+            response = self.session.get(
+                self.api_endpoint,
+                params=params,
+                headers={"User-Agent": random.choice(self._USER_AGENTS)},
+                timeout=30
+            )
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed: {e}")
-                self.errors_encountered.append(f"Request failed: {e}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            self.errors_encountered.append(f"Request failed: {e}")
+            return False, {}
 
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+        if response.status_code != 200:
+            logger.error(f"HTTP {response.status_code}: {response.text[:200]}")
+            self.errors_encountered.append(f"HTTP {response.status_code}")
+            return False, {}
 
-        return False, {}
+        try:
+            return True, orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"JSON decode error: {e}")
+            logger.debug(f"Response content: {response.text[:200]}")
+            self.errors_encountered.append(f"JSON decode error: {e}")
+            return False, {}
 
     def scrape_jobs(self, keyword: str, location: str = "", max_results: int = 100) -> List[JobData]:
         """
         Main scraping method with comprehensive error handling
 
+        Args:
+            keyword: Job search keyword
+            location: Location filter (optional)
+            max_results: Maximum number of jobs to scrape
+
+        Returns:
+            List of JobData objects
+        """
+        return asyncio.run(self._scrape_jobs_async(keyword, location, max_results))
+
+    async def _fetch_page(self, semaphore: asyncio.Semaphore, params: Dict) -> Tuple[bool, Dict]:
+        """
+        Fetch a single results page without blocking the event loop
+
+        Args:
+            semaphore: Semaphore bounding the number of concurrent requests
+            params: Request parameters
+
+        Returns:
+            Tuple of (success: bool, response_data: dict)
+        """
+        async with semaphore:
+            return await asyncio.to_thread(self._make_api_request, params)
+
+    async def _scrape_jobs_async(self, keyword: str, location: str, max_results: int) -> List[JobData]:
+        """
+        Fetch the first page to learn the page count, then fetch further
+        pages concurrently in batches until max_results jobs are collected
+        or the results run out. Each batch covers the jobs still missing,
+        so rows skipped as untitled or duplicate are made up by later pages.
+        No further batches are requested once any page fails.
+
         Args:
             keyword: Job search keyword
             location: Location filter (optional)
@@ -236,69 +279,125 @@ class NaukriScraper:
         logger.info(f"Starting scrape: keyword='{keyword}', location='{location}', max_results={max_results}")
 
         jobs = []
-        page = 1
+        seen_ids = set()
+        if max_results <= 0:
+            self.jobs_scraped = jobs
+            return jobs
+
         jobs_per_page = min(20, max_results)  # API limit is 20 per page
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
-        while len(jobs) < max_results:
-            # Prepare request parameters
-            params = {
-                "noOfResults": jobs_per_page,
-                "keyword": keyword,
-                "pageNo": page
-            }
+        base_params = {
+            "noOfResults": jobs_per_page,
+            "keyword": keyword
+        }
+        if location:
+            base_params["location"] = self._get_location_id(location)
+
+        logger.info("Scraping page 1")
+        success, data = await self._fetch_page(semaphore, {**base_params, "pageNo": 1})
+
+        if not success:
+            logger.error("Failed to fetch page 1")
+            self.jobs_scraped = jobs
+            return jobs
+
+        total_pages = data.get("totalpages", 0)
+        first_page = 1
+        results = [(True, data)]
+
+        while True:
+            exhausted = False
+            page_failed = False
+            for page, result in enumerate(results, start=first_page):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to fetch page {page}: {result}")
+                    self.errors_encountered.append(f"Page {page} failed: {result}")
+                    page_failed = True
+                    continue
 
-            if location:
-                params["location"] = self._get_location_id(location)
+                success, data = result
+                if not success:
+                    logger.error(f"Failed to fetch page {page}")
+                    page_failed = True
+                    continue
 
-            logger.info(f"Scraping page {page} (jobs collected: {len(jobs)})")
+                # Extract jobs from response
+                job_list = data.get("list", [])
+                total_available = data.get("totaljobs", 0)
 
-            # Make API request
-            success, data = self._make_api_request(params)
+                if not job_list:
+                    logger.info("No more jobs found")
+                    exhausted = True
+                    break
 
-            if not success:
-                logger.error(f"Failed to fetch page {page}")
-                break
+                logger.info(f"Processing {len(job_list)} jobs from page {page} (Total available: {total_available})")
 
-            # Extract jobs from response
-            job_list = data.get("list", [])
-            total_available = data.get("totaljobs", 0)
+                # Process each job
+                scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                for job_raw in job_list:
+                    if len(jobs) >= max_results:
+                        break
 
-            if not job_list:
-                logger.info("No more jobs found")
-                break
+                    job_data = self._parse_job_data(job_raw, scraped_at=scraped_at)
+
+                    # Only add jobs with valid titles
+                    if not job_data.job_title:
+                        logger.warning("Skipped job with missing title")
+                        continue
+
+                    # Listings can shift between pages while they are fetched
+                    if job_data.job_id:
+                        if job_data.job_id in seen_ids:
+                            logger.debug(f"Skipped duplicate job {job_data.job_id}")
+                            continue
+                        seen_ids.add(job_data.job_id)
 
-            logger.info(f"Processing {len(job_list)} jobs from page {page} (Total available: {total_available})")
+                    jobs.append(job_data)
 
-            # Process each job
-            for job_raw in job_list:
                 if len(jobs) >= max_results:
                     break
 
-                job_data = self._parse_job_data(job_raw)
-
-                # Only add jobs with valid titles
-                if job_data.job_title:
-                    jobs.append(job_data)
-                else:
-                    logger.warning("Skipped job with missing title")
+            # A failed page usually means we are blocked or rate limited;
+            # keep what this batch returned but request no further pages
+            if page_failed:
+                logger.error("Stopping after failed page request(s)")
+                break
 
-            # Check if we should continue
-            total_pages = data.get("totalpages", 0)
-            if page >= total_pages:
-                logger.info(f"Reached last page ({total_pages})")
+            next_page = first_page + len(results)
+            if exhausted or len(jobs) >= max_results or next_page > total_pages:
+                if next_page > total_pages:
+                    logger.info(f"Reached last page ({total_pages})")
                 break
 
-            page += 1
+            # Only request the pages needed to cover the jobs still missing
+            remaining = max_results - len(jobs)
+            last_page = min(total_pages, next_page + math.ceil(remaining / jobs_per_page) - 1)
+            logger.info(f"Scraping pages {next_page}-{last_page} concurrently (total pages: {total_pages})")
 
-            # Implement polite delay to avoid rate limiting
-            delay = random.uniform(1, 3)
-            logger.debug(f"Waiting {delay:.1f}s before next request")
-            time.sleep(delay)
+            tasks = [
+                self._fetch_page(semaphore, {**base_params, "pageNo": page})
+                for page in range(next_page, last_page + 1)
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            first_page = next_page
 
         logger.info(f"Scraping completed. Collected {len(jobs)} jobs")
         self.jobs_scraped = jobs
         return jobs
 
+    def _jobs_to_df(self, jobs: List[JobData]) -> pd.DataFrame:
+        """
+        Build a DataFrame from job records
+
+        Args:
+            jobs: List of JobData objects
+
+        Returns:
+            DataFrame with one column per JobData field
+        """
+        return pd.DataFrame.from_records(map(_job_row, jobs), columns=JOB_COLUMNS)
+
     def save_to_csv(self, jobs: List[JobData], filename: str = "naukri_jobs.csv") -> bool:
         """
         Save job data to CSV file
@@ -315,8 +414,8 @@ class NaukriScraper:
                 logger.warning("No jobs to save")
                 return False
 
-            df = pd.DataFrame([asdict(job) for job in jobs])
-            df.to_csv(filename, index=False, encoding='utf-8')
+            df = self._jobs_to_df(jobs)
+            df.to_csv(filename, index=False, encoding='utf-8', chunksize=10_000, lineterminator='\n')
 
             logger.info(f"Saved {len(jobs)} jobs to {filename}")
             return True
@@ -325,6 +424,32 @@ class NaukriScraper:
             logger.error(f"Error saving to CSV: {e}")
             return False
 
+    def save_to_parquet(self, jobs: List[JobData], filename: str = "naukri_jobs.parquet") -> bool:
+        """
+        Save job data to a zstd-compressed Parquet file
+
+        Args:
+            jobs: List of JobData objects
+            filename: Output filename
+
+        Returns:
+            Success status
+        """
+        try:
+            if not jobs:
+                logger.warning("No jobs to save")
+                return False
+
+            df = self._jobs_to_df(jobs)
+            df.to_parquet(filename, engine='pyarrow', compression='zstd', index=False)
+
+            logger.info(f"Saved {len(jobs)} jobs to {filename}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving to Parquet: {e}")
+            return False
+
     def save_to_excel(self, jobs: List[JobData], filename: str = "naukri_jobs.xlsx") -> bool:
         """
         Save job data to Excel file with formatting
@@ -341,29 +466,27 @@ class NaukriScraper:
                 logger.warning("No jobs to save")
                 return False
 
-            df = pd.DataFrame([asdict(job) for job in jobs])
+            df = self._jobs_to_df(jobs)
 
-            # Try to use openpyxl if available
+            # Prefer xlsxwriter: widths come from the DataFrame, not cell objects
             try:
-                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
                     df.to_excel(writer, sheet_name='Jobs', index=False)
 
                     # Auto-adjust column widths
                     worksheet = writer.sheets['Jobs']
-                    for column in worksheet.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = min(max_length + 2, 50)
-                        worksheet.column_dimensions[column_letter].width = adjusted_width
+                    for i, col in enumerate(df.columns):
+                        if pd.api.types.is_numeric_dtype(df[col]):
+                            # Numeric columns have a bounded printed width
+                            width = max(12, len(col) + 2)
+                        else:
+                            longest = df[col].astype(str).str.len().max()
+                            max_length = max(0 if pd.isna(longest) else int(longest), len(col))
+                            width = min(max_length + 2, 50)
+                        worksheet.set_column(i, i, width)
 
             except ImportError:
-                # Fallback to xlsxwriter if openpyxl not available
+                # Fallback to openpyxl if xlsxwriter not available
                 df.to_excel(filename, index=False)
 
             logger.info(f"Saved {len(jobs)} jobs to {filename}")
@@ -386,14 +509,15 @@ class NaukriScraper:
         if not jobs:
             return {"total_jobs": 0, "errors_encountered": len(self.errors_encountered)}
 
-        df = pd.DataFrame([asdict(job) for job in jobs])
+        companies = Counter(job.company_name for job in jobs)
+        locations = Counter(job.location for job in jobs)
 
         summary = {
             "total_jobs": len(jobs),
-            "unique_companies": df['company_name'].nunique(),
-            "unique_locations": df['location'].nunique(),
-            "top_companies": df['company_name'].value_counts().head(10).to_dict(),
-            "top_locations": df['location'].value_counts().head(10).to_dict(),
+            "unique_companies": len(companies),
+            "unique_locations": len(locations),
+            "top_companies": dict(companies.most_common(10)),
+            "top_locations": dict(locations.most_common(10)),
             "errors_encountered": len(self.errors_encountered),
             "success_rate": f"{((len(jobs) / (len(jobs) + len(self.errors_encountered))) * 100):.1f}%" if self.errors_encountered else "100%"
         }
@@ -404,21 +528,32 @@ def main():
     """
     Main execution function with command line interface
     """
-    if len(sys.argv) < 2:
+    # Split optional output flags from positional arguments
+    flags = {arg for arg in sys.argv[1:] if arg.startswith("--")}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+
+    unknown_flags = flags - {"--csv", "--excel"}
+    if unknown_flags:
+        print(f"\n❌ Unknown option(s): {', '.join(sorted(unknown_flags))}")
+
+    if not args or unknown_flags:
         print("\nNaukri.com Job Scraper - Professional Version")
         print("=" * 50)
-        print("Usage: python naukri_scraper.py <keyword> [location] [max_results]")
+        print("Usage: python naukri_scraper.py <keyword> [location] [max_results] [--csv] [--excel]")
         print("\nExamples:")
         print("  python naukri_scraper.py 'python developer'")
         print("  python naukri_scraper.py 'data scientist' bangalore")
-        print("  python naukri_scraper.py 'software engineer' mumbai 50")
+        print("  python naukri_scraper.py 'software engineer' mumbai 50 --csv --excel")
+        print("\nResults are saved as Parquet; --csv and --excel add those formats.")
         print("\nSupported locations: bangalore, mumbai, delhi, pune, hyderabad, chennai, etc.")
         return
 
     # Parse command line arguments
-    keyword = sys.argv[1]
-    location = sys.argv[2] if len(sys.argv) > 2 else ""
-    max_results = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    keyword = args[0]
+    location = args[1] if len(args) > 1 else ""
+    max_results = int(args[2]) if len(args) > 2 else 100
+    write_csv = "--csv" in flags
+    write_excel = "--excel" in flags
 
     # Initialize scraper
     scraper = NaukriScraper()
@@ -432,17 +567,28 @@ def main():
             return
 
         # Generate output filenames
-        safe_keyword = "".join(c for c in keyword if c.isalnum() or c in (' ', '-', '_')).replace(' ', '_').lower()
+        safe_keyword = _UNSAFE_FILENAME_CHARS.sub('', keyword).replace(' ', '_').lower()
         base_filename = f"naukri_{safe_keyword}"
         if location:
             base_filename += f"_{location.lower()}"
 
-        # Save to multiple formats
+        # Parquet is always written; CSV and Excel only on request
+        parquet_filename = f"{base_filename}.parquet"
         csv_filename = f"{base_filename}.csv"
         excel_filename = f"{base_filename}.xlsx"
 
-        csv_success = scraper.save_to_csv(jobs, csv_filename)
-        excel_success = scraper.save_to_excel(jobs, excel_filename)
+        parquet_success = scraper.save_to_parquet(jobs, parquet_filename)
+        if not parquet_success and not write_csv:
+            logger.warning("Parquet export failed, falling back to CSV")
+            write_csv = True
+
+        csv_success = write_csv and scraper.save_to_csv(jobs, csv_filename)
+        excel_success = write_excel and scraper.save_to_excel(jobs, excel_filename)
+
+        if not (parquet_success or csv_success or excel_success):
+            logger.error("Failed to save scraped jobs in any format")
+            print("\n❌ Error: no output file could be written")
+            return
 
         # Generate and display summary
         summary = scraper.generate_summary_report(jobs)
@@ -455,17 +601,19 @@ def main():
         print(f"📍 Unique Locations: {summary['unique_locations']}")
         print(f"✅ Success Rate: {summary['success_rate']}")
 
+        if parquet_success:
+            print(f"📦 Parquet File: {parquet_filename}")
         if csv_success:
             print(f"📄 CSV File: {csv_filename}")
         if excel_success:
             print(f"📊 Excel File: {excel_filename}")
 
         print("\n📈 Top Companies:")
-        for company, count in list(summary['top_companies'].items())[:5]:
+        for company, count in islice(summary['top_companies'].items(), 5):
             print(f"  • {company}: {count} jobs")
 
         print("\n🌍 Top Locations:")
-        for location, count in list(summary['top_locations'].items())[:5]:
+        for location, count in islice(summary['top_locations'].items(), 5):
             print(f"  • {location}: {count} jobs")
 
         print("\n🔗 Sample Jobs:")
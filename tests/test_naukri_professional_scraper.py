@@ -0,0 +1,63 @@
+import logging
+import unittest
+from unittest import mock
+
+import orjson
+
+from naukri_professional_scraper import NaukriScraper
+
+
+def _response(status_code: int, payload=None) -> mock.Mock:
+    """Build a stand-in for requests.Response"""
+    content = orjson.dumps(payload) if payload is not None else b""
+    return mock.Mock(status_code=status_code, content=content, text=content.decode())
+
+
+def _page(page: int, size: int = 20, total_pages: int = 2500) -> dict:
+    """Build an API payload with `size` titled jobs for the given page"""
+    return {
+        "list": [
+            {"jobId": f"{page}{i:03d}", "post": f"Job {page}-{i}", "companyName": "Acme", "city": "Bangalore"}
+            for i in range(size)
+        ],
+        "totalpages": total_pages,
+        "totaljobs": total_pages * size,
+    }
+
+
+class ScrapeJobsPaginationTest(unittest.TestCase):
+    def setUp(self):
+        # Keep test runs out of naukri_scraper.log and the console
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.scraper = NaukriScraper()
+        self.requested_pages = []
+
+    def _mock_get(self, fail_from_page: int):
+        def get(url, params=None, **kwargs):
+            page = params["pageNo"]
+            self.requested_pages.append(page)
+            if page >= fail_from_page:
+                return _response(403)
+            return _response(200, _page(page))
+        return mock.patch.object(self.scraper.session, "get", side_effect=get)
+
+    def test_stops_after_failed_batch(self):
+        with self._mock_get(fail_from_page=2):
+            jobs = self.scraper.scrape_jobs("python developer", "bangalore", 100)
+
+        # Page 1 plus a single batch for the remaining 80 jobs
+        self.assertEqual(sorted(self.requested_pages), [1, 2, 3, 4, 5])
+        self.assertEqual(len(jobs), 20)
+
+    def test_collects_max_results_across_batches(self):
+        with self._mock_get(fail_from_page=2500):
+            jobs = self.scraper.scrape_jobs("python developer", "bangalore", 100)
+
+        self.assertEqual(sorted(self.requested_pages), [1, 2, 3, 4, 5])
+        self.assertEqual(len(jobs), 100)
+        self.assertEqual(len({job.job_id for job in jobs}), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()